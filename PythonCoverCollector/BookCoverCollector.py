@@ -1,40 +1,354 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import random
+import re
+import shutil
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox
+import PIL
 from PIL import Image, ImageTk
-import io
 import json
+import logging
+import hashlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson # Optional; several times faster than stdlib json on large OpenLibrary responses
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
 
 # --- Data Fetching from OpenLibrary ---
 
+def _json_loads(data):
+    """Parses JSON bytes with orjson when available, else with the stdlib json module."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# Maximum number of concurrent requests to OpenLibrary (worker threads and pooled connections per host)
+MAX_IO_WORKERS = 8
+
+# Single executor shared by every background fetch (search pages, details, covers,
+# prefetches), so total concurrency to OpenLibrary is capped at MAX_IO_WORKERS.
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_IO_WORKERS, thread_name_prefix="ol-io")
+
+# Sustained request rate to OpenLibrary; bursts of up to MAX_IO_WORKERS are allowed
+REQUESTS_PER_SECOND = 10
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter: `rate` acquisitions per second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until it becomes available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1 # Reserve our token; a negative balance is the queue ahead of refill
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+# Module-level so the budget applies to every request, whichever session sends it
+RATE_LIMITER = TokenBucket(REQUESTS_PER_SECOND, capacity=MAX_IO_WORKERS)
+
+def _limited_get(session, url, **kwargs):
+    """session.get(url, **kwargs) after taking a token from RATE_LIMITER."""
+    RATE_LIMITER.acquire()
+    return session.get(url, **kwargs)
+
+# One shared session so every request reuses pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per call. Each host gets its own
+# adapter sized to MAX_IO_WORKERS; pool_block makes extra concurrent callers wait
+# for a warm connection instead of opening throwaway sockets beyond the pool.
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "BookCoverCollector/1.0 (PythonScripts)"
+for _host in ("https://openlibrary.org", "https://covers.openlibrary.org"):
+    SESSION.mount(_host, HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_IO_WORKERS,
+        pool_block=True,
+        # 429 is retried too; Retry honours the server's Retry-After before trying again
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+    ))
+
+# Responses (work JSON and cover bytes) are cached on disk so repeat views and
+# later runs don't hit the network again. The cache is an LRU bounded by
+# CACHE_MAX_BYTES: hits refresh a file's atime (mtime stays the download time that
+# DETAILS_MAX_AGE is measured against) and the least recently used files go first.
+CACHE_DIR = Path.home() / ".cache" / "bookcover"
+DETAILS_MAX_AGE = 7 * 24 * 3600 # Seconds before a cached work JSON is refetched; cover images never change
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+STALE_TMP_AGE = 3600 # Seconds before a leftover .tmp file (from a killed run) is swept
+
+_cache_lock = threading.Lock()
+_cache_bytes = None # Running total size of CACHE_DIR, scanned on the first write of each run
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _stream_to_file(res, path):
+    """Writes a stream=True response body to path chunk by chunk, removing the file if the transfer fails.
+
+    iter_content (rather than copying res.raw) keeps transfer errors as requests exceptions.
+    """
+    try:
+        # Chunks are already large, so write them unbuffered instead of copying through an 8 KiB buffer
+        with open(path, "wb", buffering=0) as f:
+            for chunk in res.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view: # Raw writes may be partial
+                    view = view[f.write(view):]
+    except BaseException:
+        Path(path).unlink(missing_ok=True)
+        raise
+
+def _prune_cache():
+    """Sweeps stale temp files and evicts least recently used entries once CACHE_DIR exceeds CACHE_MAX_BYTES.
+
+    Returns the remaining total size. Caller holds _cache_lock.
+    """
+    now = time.time()
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        try:
+            st = entry.stat()
+        except FileNotFoundError:
+            continue # Removed by another run meanwhile
+        if entry.name.endswith(".tmp"):
+            if now - st.st_mtime > STALE_TMP_AGE:
+                Path(entry.path).unlink(missing_ok=True)
+            continue
+        entries.append((st.st_atime, st.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    if total > CACHE_MAX_BYTES:
+        entries.sort() # Least recently used first
+        for _, size, path in entries:
+            if total <= CACHE_MAX_BYTES * 0.8: # Leave headroom so the next writes don't prune again
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+    return total
+
+def _note_cache_write(size):
+    """Accounts for a new cache file of size bytes, pruning the cache when it grows past its bound."""
+    global _cache_bytes
+    with _cache_lock:
+        try:
+            if _cache_bytes is None or _cache_bytes + size > CACHE_MAX_BYTES:
+                _cache_bytes = _prune_cache() # The scan already counts the new file
+            else:
+                _cache_bytes += size
+        except OSError as e: # Pruning is housekeeping; the file itself was cached fine
+            log.debug("Could not prune %s: %s", CACHE_DIR, e)
+
+def _cached_path(url, timeout=10, max_age=None):
+    """Returns the on-disk cache file holding the body of a successful GET for url, downloading it if needed.
+
+    With max_age (seconds), a cached file older than that is downloaded again; if that
+    refresh fails, the stale copy is returned so cached data keeps working offline.
+    """
+    path = CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+    stale = False
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        pass # Not cached yet
+    else:
+        if max_age is None or time.time() - st.st_mtime < max_age:
+            try:
+                os.utime(path, ns=(time.time_ns(), st.st_mtime_ns)) # Mark as recently used for LRU eviction
+            except OSError:
+                pass # Read-only cache; still usable
+            return path
+        stale = True
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp") # Write then rename so readers never see a partial file
+    # Stream the body straight to disk instead of buffering it all in memory first
+    try:
+        with _limited_get(SESSION, url, stream=True, timeout=timeout) as res:
+            res.raise_for_status() # Only successful responses are cached
+            _stream_to_file(res, tmp_path)
+    except requests.RequestException as e:
+        if not stale:
+            raise
+        log.debug("Refresh of %s failed (%s), using the stale cached copy", url, e)
+        return path
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _note_cache_write(path.stat().st_size)
+    return path
+
+def _open_cached(url, timeout=10, max_age=None):
+    """Returns a binary file object holding the body of a successful GET for url.
+
+    Reads from the on-disk cache when possible. If the cache can't be used (unwritable
+    CACHE_DIR, full disk...), the body is fetched uncached into memory instead.
+    Raises requests.RequestException on network or HTTP errors.
+    """
+    try:
+        return open(_cached_path(url, timeout, max_age), "rb")
+    except requests.RequestException: # Subclasses OSError, but it's a fetch failure, not a cache one
+        raise
+    except OSError as e:
+        log.debug("Cache unavailable for %s (%s), fetching without it", url, e)
+    res = _limited_get(SESSION, url, timeout=timeout)
+    res.raise_for_status()
+    return io.BytesIO(res.content)
+
+def _cached_get(url, timeout=10, max_age=None):
+    """Returns the body of a successful GET for url, using the on-disk cache when possible."""
+    with _open_cached(url, timeout, max_age) as f:
+        return f.read()
+
+@lru_cache(maxsize=512)
+def _get_work_json(book_key):
+    """Returns the parsed work JSON for book_key. Raises on failure so errors are never cached."""
+    return _json_loads(_cached_get(f"https://openlibrary.org{book_key}.json", timeout=10, max_age=DETAILS_MAX_AGE))
+
 def fetch_book_details(book_key):
     """Fetches detailed information for a book using its OpenLibrary key."""
     if not book_key:
         return None, "No key provided"
     try:
-        detail_url = f"https://openlibrary.org{book_key}.json"
-        res = requests.get(detail_url, timeout=10)
-        if res.status_code == 200:
-            data = res.json()
-            description = "Not available."
-            desc_obj = data.get("description")
-            if isinstance(desc_obj, str):
-                description = desc_obj
-            elif isinstance(desc_obj, dict) and "value" in desc_obj:
-                description = desc_obj["value"]
-            
-            # Extract other details if needed, e.g., more specific subjects, ISBNs
-            # For now, primarily focusing on description.
-            return {"description": description}, None
-        else:
-            return None, f"Failed to fetch details, status: {res.status_code}"
+        data = _get_work_json(book_key)
+        description = "Not available."
+        desc_obj = data.get("description")
+        if isinstance(desc_obj, str):
+            description = desc_obj
+        elif isinstance(desc_obj, dict) and "value" in desc_obj:
+            description = desc_obj["value"]
+        
+        # Extract other details if needed, e.g., more specific subjects, ISBNs
+        # For now, primarily focusing on description.
+        return {"description": description}, None
+    except requests.HTTPError as e:
+        return None, f"Failed to fetch details, status: {e.response.status_code}"
     except requests.RequestException as e:
         return None, f"Request exception for details: {e}"
-
-def fetch_random_books(n):
+    except OSError as e: # Cache file unreadable; keep the (None, error_msg) contract
+        return None, f"Failed to read cached details: {e}"
+    except json.JSONDecodeError as e:
+        return None, f"Invalid details JSON: {e}"
+
+# Resampling filter for cover thumbnails, looked up once. BILINEAR is indistinguishable
+# from LANCZOS at thumbnail size and much cheaper.
+_COVER_RESAMPLE = Image.Resampling.BILINEAR
+
+def fetch_cover_image(cover_url, max_h=250):
+    """Downloads a cover and returns it as a PIL image resized to at most max_h pixels high.
+
+    Safe to call from a worker thread; raises requests.RequestException or PIL errors on failure.
+    """
+    # Pillow reads straight from the cache file, so no separate bytes buffer is built
+    with _open_cached(cover_url, timeout=10) as f:
+        image = Image.open(f)
+        # Let libjpeg decode at a reduced DCT scale (~2x the target) instead of full resolution
+        image.draft("RGB", (max_h * 2, max_h * 2))
+        
+        # Resize in place to fit the label height (keeps aspect ratio, never upscales)
+        image.thumbnail((image.width, max_h), _COVER_RESAMPLE)
+        image.load() # thumbnail() skips loading covers that already fit; read them before the file closes
+    return image
+
+def _cover_url(cover_id, size):
+    """Builds a cover URL from an OpenLibrary cover id (size is "S", "M" or "L").
+
+    Id-based URLs are served directly; /b/isbn/ URLs answer with a redirect to these.
+    default=false makes the server answer 404 instead of sending its blank placeholder image.
+    """
+    return f"https://covers.openlibrary.org/b/id/{cover_id}-{size}.jpg?default=false"
+
+# fields= limits the response to what we use, and first_sentence often saves the /works/ round-trip
+SEARCH_FIELDS = "key,title,author_name,subject,isbn,cover_i,first_sentence"
+SEARCH_URL = "https://openlibrary.org/search.json?q=language:eng&subject_facet=Fiction&subject_facet=Non-fiction&sort=random&limit={limit}&page={page}&fields=" + SEARCH_FIELDS
+SEARCH_PAGE_SIZE = 50 # Docs per page in the concurrent fallback rounds
+MAX_SEARCH_LIMIT = 1000 # Largest single request we make for the initial targeted query
+MAX_CONCURRENT_PAGES = MAX_IO_WORKERS # Upper bound on search pages in flight at once, to respect the server
+
+def _fetch_search_page(session, page, limit=SEARCH_PAGE_SIZE):
+    """Fetches one page of search results. Returns (docs, error_msg)."""
+    try:
+        res = _limited_get(session, SEARCH_URL.format(page=page, limit=limit), timeout=15)
+        if res.status_code != 200:
+            return None, f"API request failed with status {res.status_code}"
+        return _json_loads(res.content).get("docs", []), None
+    except requests.exceptions.Timeout:
+        return None, "Request timed out"
+    except requests.RequestException as e:
+        return None, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return None, "JSON decode error"
+
+def _first_sentence(doc):
+    """Returns the first sentence from a search doc, or None if it has none."""
+    sentence = doc.get("first_sentence")
+    if not sentence:
+        return None
+    if isinstance(sentence, list):
+        return sentence[0]
+    return sentence
+
+def _doc_to_book(doc):
+    """Builds the app's book dict from a search result doc that has a cover_i and a title."""
+    cover_id = doc["cover_i"]
+    first_sentence = _first_sentence(doc)
+
+    authors = doc.get("author_name", ["Unknown Author"])
+    subjects = doc.get("subject", [])
+    ol_subjects_str = ", ".join(subjects[:5]) + ("..." if len(subjects) > 5 else "")
+
+    return {
+        "title": doc["title"],
+        "cover_id": cover_id,
+        "cover_url_large": _cover_url(cover_id, "L"),
+        "cover_url_medium": _cover_url(cover_id, "M"),
+        "authors": authors,
+        "openlibrary_key": doc["key"],
+        "subjects_from_ol": subjects,
+        "isbn": doc.get("isbn", []),
+        # Display strings precomputed once so navigation is just label updates
+        "_authors_str": ", ".join(authors),
+        "_ol_subjects_str": ol_subjects_str,
+        # Placeholder unless the search response already carried a first sentence
+        "description": first_sentence or "Description not loaded yet. Will load on demand.",
+        "description_loaded": bool(first_sentence) # Flag to indicate if a description is available without another fetch
+    }
+
+def _warm_details(book_keys):
+    """Queues fetch_book_details for each key without waiting, then empties book_keys."""
+    for book_key in book_keys:
+        EXECUTOR.submit(fetch_book_details, book_key)
+    book_keys.clear()
+
+def fetch_random_books(n, *, session=None):
+    """Returns up to n random books with covers from the OpenLibrary search API.
+
+    session defaults to the shared SESSION; a custom requests.Session is still held to
+    RATE_LIMITER but brings its own pooling and retry policy. Only the search requests
+    use it: the description warm-ups queued here go through fetch_book_details, which
+    (like the cached-detail and cover lookups used by BookManagerApp) always uses SESSION.
+    """
+    session = session or SESSION
     books_data = []
     tries = 0
     # Optimized max_tries: (n // 5 usable books per API call on average) + 20 buffer
@@ -50,72 +364,141 @@ def fetch_random_books(n):
     
     # Use a set to avoid duplicate book processing if keys are repeated in search results
     processed_keys = set()
-
-    with requests.Session() as session: # Use a session for potential keep-alive benefits
-        while len(books_data) < n and tries < max_tries:
+    # Draw pages without replacement so no page is ever requested twice
+    unrequested_pages = random.sample(range(1, 501), 500)
+    failed_rounds = 0
+    warm_keys = [] # Description lookups waiting to be queued behind the next round's search pages
+
+    # The first request is a single query sized for n (most results carry a cover), which
+    # usually suffices on its own. Only if it comes up short are further pages requested,
+    # in concurrent rounds so a round costs roughly one RTT instead of one RTT per page.
+    while len(books_data) < n and tries < max_tries and unrequested_pages:
+        if tries == 0:
+            limit = min(max(n * 3, SEARCH_PAGE_SIZE), MAX_SEARCH_LIMIT)
+            round_size = 1
+        else:
+            # Only ask for as many pages as we are likely to still need
+            limit = SEARCH_PAGE_SIZE
+            needed_pages = (n - len(books_data)) // 5 + 1
+            round_size = min(MAX_CONCURRENT_PAGES, needed_pages, max_tries - tries, len(unrequested_pages))
+        pages = [unrequested_pages.pop() for _ in range(round_size)]
+        results = EXECUTOR.map(lambda page: _fetch_search_page(session, page, limit), pages)
+        # Only now, with this round's pages already queued ahead of them, start the previous
+        # round's description lookups, so they overlap the search instead of delaying it
+        _warm_details(warm_keys)
+
+        round_failed = False
+        for docs, error_msg in results:
             tries += 1
-            page = random.randint(1, 500) 
-            try:
-                # Increased limit to 50 to fetch more candidates per API call
-                search_url = f"https://openlibrary.org/search.json?q=language:eng&subject_facet=Fiction&subject_facet=Non-fiction&sort=random&limit=50&page={page}"
-                res = session.get(search_url, timeout=15)
-                
-                if res.status_code != 200:
-                    print(f"API request failed with status {res.status_code}, retrying... (Attempt {tries}/{max_tries})", end="\\\\r")
-                    time.sleep(0.5)
-                    continue
-                
-                docs = res.json().get("docs", [])
-                random.shuffle(docs)
-                
-                for doc in docs:
-                    if len(books_data) >= n:
-                        break
-
-                    book_key = doc.get("key")
-                    if not book_key or book_key in processed_keys:
-                        continue 
-
-                    if "cover_i" in doc and "title" in doc:
-                        processed_keys.add(book_key)
-                        
-                        book_info = {
-                            "title": doc.get("title", "Unknown Title"),
-                            "cover_id": doc["cover_i"],
-                            "cover_url_large": f"https://covers.openlibrary.org/b/id/{doc['cover_i']}-L.jpg",
-                            "cover_url_medium": f"https://covers.openlibrary.org/b/id/{doc['cover_i']}-M.jpg",
-                            "authors": doc.get("author_name", ["Unknown Author"]),
-                            "openlibrary_key": book_key,
-                            "subjects_from_ol": doc.get("subject", []),
-                            "isbn": doc.get("isbn", []),
-                            "description": "Description not loaded yet. Will load on demand.", # Placeholder
-                            "description_loaded": False # Flag to indicate if full description has been fetched
-                        }
-                        
-                        # Removed fetch_book_details from here to speed up initial loading
-
-                        books_data.append(book_info)
-                        print(f"Found {len(books_data)}/{n} books... (Attempt {tries}/{max_tries})", end="\\\\r")
-
-                time.sleep(0.2) 
-            except requests.exceptions.Timeout:
-                print(f"Request timed out on attempt {tries}/{max_tries}, retrying...", end="\\\\r")
-                time.sleep(1)
-            except requests.RequestException as e:
-                print(f"Request failed on attempt {tries}/{max_tries}: {e}, retrying...", end="\\\\r")
-                time.sleep(0.5)
-            except json.JSONDecodeError:
-                print(f"JSON decode error on attempt {tries}/{max_tries}, skipping page...", end="\\\\r")
-                time.sleep(0.5)
-
-    print(f"\\\\nFinished fetching. Found {len(books_data)} books after {tries} tries.")
+            if error_msg:
+                round_failed = True
+                log.debug("%s on attempt %s/%s, retrying...", error_msg, tries, max_tries)
+                continue
+
+            random.shuffle(docs)
+            
+            for doc in docs:
+                if len(books_data) >= n:
+                    break
+
+                book_key = doc.get("key")
+                if not book_key or book_key in processed_keys:
+                    continue 
+
+                if "cover_i" in doc and "title" in doc:
+                    processed_keys.add(book_key)
+                    book_info = _doc_to_book(doc)
+                    books_data.append(book_info)
+                    log.debug("Accepted %s (%s)", book_key, book_info["title"])
+
+                    # Only the first books the user will see are warmed; later ones are covered by the
+                    # GUI's neighbour prefetch, and queueing all of them would make the first cover
+                    # wait behind the whole batch.
+                    if not book_info["description_loaded"] and len(books_data) <= MAX_IO_WORKERS:
+                        warm_keys.append(book_key)
+
+        # One progress line per round rather than per book keeps stdout off the hot path
+        print(f"Found {len(books_data)}/{n} books... (Attempt {tries}/{max_tries})", end="\r")
+
+        # Back off exponentially after a round with errors (e.g. rate limiting) instead of
+        # spending the remaining tries at full speed
+        if round_failed and len(books_data) < n and tries < max_tries:
+            failed_rounds += 1
+            time.sleep(min(0.5 * 2 ** failed_rounds, 8))
+
+    _warm_details(warm_keys) # No further round to overlap with
+    print(f"\nFinished fetching. Found {len(books_data)} books after {tries} tries.")
     if not books_data and tries >= max_tries:
         print("Could not fetch any books after maximum tries.")
     return books_data
 
 # --- Tkinter GUI Application ---
 
+# Separators accepted between pasted IDs, all normalised to commas in one C-level pass
+_ID_SEPARATORS = str.maketrans({"\n": ",", "\r": ",", ";": ",", "\t": ","})
+
+def parse_id_list(text):
+    """Parses a comma/semicolon/newline separated list of integer IDs, dropping blanks and duplicates.
+
+    Raises ValueError if any entry is not an integer.
+    """
+    return list(dict.fromkeys(int(token) for part in text.translate(_ID_SEPARATORS).split(",") if (token := part.strip())))
+
+# Builders for the Strapi form rows; each creates its widget in column 1 of the given row
+def _grid_field(widget, row):
+    widget.grid(row=row, column=1, sticky=tk.EW, padx=5, pady=3, columnspan=2)
+    return widget
+
+def _build_entry(parent, row, var, options):
+    return _grid_field(ttk.Entry(parent, textvariable=var, width=40), row)
+
+def _build_combobox(parent, row, var, options):
+    return _grid_field(ttk.Combobox(parent, textvariable=var, values=options, state="readonly", width=38), row)
+
+def _build_checkbutton(parent, row, var, options):
+    return _grid_field(ttk.Checkbutton(parent, variable=var), row)
+
+def _build_spinbox(parent, row, var, options):
+    return _grid_field(ttk.Spinbox(parent, textvariable=var, from_=0, to=5, width=5, state="readonly"), row)
+
+def _build_text(parent, row, var, options):
+    """Multi-line Text widget (for description) with its own vertical scrollbar in column 3."""
+    widget = _grid_field(tk.Text(parent, width=50, height=8, wrap=tk.WORD), row)
+    text_scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=widget.yview)
+    widget.configure(yscrollcommand=text_scrollbar.set)
+    text_scrollbar.grid(row=row, column=3, sticky=tk.NS)
+    return widget
+
+_FIELD_BUILDERS = {
+    "Entry": _build_entry,
+    "Combobox": _build_combobox,
+    "Checkbutton": _build_checkbutton,
+    "Spinbox": _build_spinbox,
+    "Text": _build_text,
+}
+
+COVER_CACHE_SIZE = 32 # Decoded covers kept in memory by the GUI
+
 class BookManagerApp:
+    # Form layout, top to bottom: (label, widget type, attribute holding its Tk variable, options)
+    FIELD_SPECS = [
+        ("Title (for Strapi):", "Entry", "title_var", None),
+        ("Author (for Strapi):", "Entry", "author_var", None), # Usually from OL, but editable
+        ("Description (for Strapi):", "Text", None, None),
+        ("Condition:", "Combobox", "condition_var", ["New", "Like New", "Good", "Fair", "Poor", "Digital Copy"]),
+        ("Book Type:", "Combobox", "book_type_var", ["For Sale", "For Swap"]),
+        ("Status:", "Combobox", "status_var", ["available", "pending", "sold"]),
+        ("Strapi User ID (owner):", "Entry", "users_permissions_user_var", None),
+        ("Price (if For Sale):", "Entry", "price_var", None),
+        ("Subject (Primary for Strapi):", "Entry", "subject_for_strapi_var", None),
+        ("Course:", "Entry", "course_var", None),
+        ("Exchange Details (if For Swap):", "Entry", "exchange_var", None),
+        ("Display Title (if different):", "Entry", "display_title_var", None),
+        ("Strapi Categories IDs (comma-sep):", "Entry", "categories_strapi_ids_var", None),
+        ("Strapi Cover Media ID:", "Entry", "cover_strapi_id_var", None),
+        ("Rating (0-5):", "Spinbox", "rating_var", None),
+    ]
+
     def __init__(self, master, books_data_list):
         self.master = master
         master.title("Book Data Manager")
@@ -123,19 +506,40 @@ class BookManagerApp:
 
         self.books_data_list = books_data_list
         self.current_book_index = 0
+        self._closed = False # Set once the window is gone; worker callbacks must not touch Tk after that
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Store user inputs for each book if needed, for now, we focus on current book export
         self.current_form_data = {} 
 
         if not self.books_data_list:
             messagebox.showinfo("No Books", "No books were fetched to display.")
-            master.destroy()
+            self._on_close()
             return
 
+        self._pending_cover_url = None
+        self._cover_request_id = 0 # Bumped per cover load; results from older loads are dropped
+        # cover_url -> resized ImageTk.PhotoImage in LRU order, so revisits skip Pillow entirely
+        self._cover_cache = OrderedDict()
+        self._covers_prefetching = set() # cover_urls currently being prefetched
+
         self._init_vars()
         self._setup_ui()
         self.load_book_data(self.current_book_index)
 
+    def _on_close(self):
+        self._closed = True
+        self.master.destroy()
+
+    def _post_to_tk(self, callback, *args):
+        """Schedules callback(*args) on the Tk thread; safe to call from a worker once the window has closed."""
+        if self._closed:
+            return
+        try:
+            self.master.after(0, callback, *args)
+        except (RuntimeError, tk.TclError): # Mainloop already exited or the interpreter is gone
+            pass
+
     def _init_vars(self):
         """Initialize Tkinter variables for form fields."""
         self.title_var = tk.StringVar()
@@ -212,53 +616,14 @@ class BookManagerApp:
         fields_frame = ttk.LabelFrame(scrollable_frame, text="Book Details for Strapi", padding="10")
         fields_frame.pack(fill=tk.X, expand=True)
 
-        row_idx = 0
-        # Helper for creating field rows
-        def add_field(label_text, widget_type, var, options=None, **kwargs):
-            nonlocal row_idx
+        # One row per FIELD_SPECS entry: label in column 0, widget from the matching builder
+        for row_idx, (label_text, widget_type, var_name, options) in enumerate(self.FIELD_SPECS):
             ttk.Label(fields_frame, text=label_text).grid(row=row_idx, column=0, sticky=tk.W, padx=5, pady=3)
-            if widget_type == "Entry":
-                widget = ttk.Entry(fields_frame, textvariable=var, width=40, **kwargs)
-            elif widget_type == "Combobox":
-                widget = ttk.Combobox(fields_frame, textvariable=var, values=options, state="readonly", width=38, **kwargs)
-            elif widget_type == "Checkbutton":
-                widget = ttk.Checkbutton(fields_frame, variable=var, **kwargs)
-            elif widget_type == "Spinbox":
-                widget = ttk.Spinbox(fields_frame, textvariable=var, from_=0, to=5, width=5, state="readonly", **kwargs)
-            elif widget_type == "Text": # For description
-                widget = tk.Text(fields_frame, width=50, height=8, wrap=tk.WORD, **kwargs)
-                # Add scrollbar for Text widget
-                text_scrollbar = ttk.Scrollbar(fields_frame, orient=tk.VERTICAL, command=widget.yview)
-                widget.configure(yscrollcommand=text_scrollbar.set)
-                widget.grid(row=row_idx, column=1, sticky=tk.EW, padx=5, pady=3, columnspan=2)
-                text_scrollbar.grid(row=row_idx, column=3, sticky=tk.NS)
-                row_idx +=1
-                return widget # Return early as grid is custom
-            else:
-                raise ValueError(f"Unsupported widget type: {widget_type}")
-            
-            widget.grid(row=row_idx, column=1, sticky=tk.EW, padx=5, pady=3, columnspan=2)
-            row_idx += 1
-            return widget
-
-        # Add fields using the helper
-        add_field("Title (for Strapi):", "Entry", self.title_var)
-        add_field("Author (for Strapi):", "Entry", self.author_var) # Usually from OL, but editable
-        
-        self.description_text_widget = add_field("Description (for Strapi):", "Text", None) # No variable for Text widget directly
-
-        add_field("Condition:", "Combobox", self.condition_var, ["New", "Like New", "Good", "Fair", "Poor", "Digital Copy"])
-        add_field("Book Type:", "Combobox", self.book_type_var, ["For Sale", "For Swap"])
-        add_field("Status:", "Combobox", self.status_var, ["available", "pending", "sold"])
-        add_field("Strapi User ID (owner):", "Entry", self.users_permissions_user_var)
-        add_field("Price (if For Sale):", "Entry", self.price_var)
-        add_field("Subject (Primary for Strapi):", "Entry", self.subject_for_strapi_var)
-        add_field("Course:", "Entry", self.course_var)
-        add_field("Exchange Details (if For Swap):", "Entry", self.exchange_var)
-        add_field("Display Title (if different):", "Entry", self.display_title_var)
-        add_field("Strapi Categories IDs (comma-sep):", "Entry", self.categories_strapi_ids_var)
-        add_field("Strapi Cover Media ID:", "Entry", self.cover_strapi_id_var)
-        add_field("Rating (0-5):", "Spinbox", self.rating_var)
+            var = getattr(self, var_name) if var_name else None
+            widget = _FIELD_BUILDERS[widget_type](fields_frame, row_idx, var, options)
+            if widget_type == "Text": # No variable for Text widget directly
+                self.description_text_widget = widget
+        row_idx = len(self.FIELD_SPECS)
         
         # Checkbuttons in their own subframe for better layout if many
         bool_frame = ttk.Frame(fields_frame)
@@ -286,40 +651,28 @@ class BookManagerApp:
 
         self.current_book_index = index
         book = self.books_data_list[index] # This is a reference to the dict in the list
+        # Every book comes from _doc_to_book, so its fields are indexed directly rather than via .get() fallbacks
 
         # Update OL Info
-        self.ol_title_label.config(text=book.get("title", "N/A"))
-        self.ol_authors_label.config(text=", ".join(book.get("authors", ["N/A"])))
-        
-        ol_subjects_str = ", ".join(book.get("subjects_from_ol", [])[:5]) 
-        if len(book.get("subjects_from_ol", [])) > 5:
-            ol_subjects_str += "..."
-        self.ol_subjects_var.set(ol_subjects_str if ol_subjects_str else "N/A")
+        self.ol_title_label.config(text=book["title"])
+        self.ol_authors_label.config(text=book["_authors_str"])
+        self.ol_subjects_var.set(book["_ol_subjects_str"] or "N/A")
 
-        self.display_cover(book.get("cover_url_medium")) 
+        self.display_cover(book["cover_url_medium"])
 
         # Update form fields (pre-fill from book data)
-        self.title_var.set(book.get("title", ""))
-        self.author_var.set(", ".join(book.get("authors", [])))
+        self.title_var.set(book["title"])
+        self.author_var.set(book["_authors_str"])
         
         # Handle description loading on demand
         self.description_text_widget.delete("1.0", tk.END)
-        if book.get("description_loaded"):
-            self.description_text_widget.insert("1.0", book.get("description", "Not available."))
+        if book["description_loaded"]:
+            self.description_text_widget.insert("1.0", book["description"])
         else:
             self.description_text_widget.insert("1.0", "Loading description...")
-            # Fetch description (this will block GUI briefly the first time)
-            # In a more advanced app, this would be in a separate thread.
-            details, error_msg = fetch_book_details(book.get("openlibrary_key"))
-            if details:
-                book["description"] = details.get("description", "Error fetching description.")
-            else:
-                book["description"] = f"Error fetching description: {error_msg}"
-            book["description_loaded"] = True # Mark as loaded
-            
-            # Update the widget again with the fetched description
-            self.description_text_widget.delete("1.0", tk.END)
-            self.description_text_widget.insert("1.0", book.get("description"))
+            # Fetch description on a worker thread so the GUI does not block on the request
+            future = EXECUTOR.submit(fetch_book_details, book["openlibrary_key"])
+            future.add_done_callback(lambda f: self._post_to_tk(self._apply_description, index, f))
 
         # Set defaults for user-input fields 
         self.condition_var.set("Good")
@@ -329,7 +682,8 @@ class BookManagerApp:
         self.price_var.set("")
         
         # Try to pick a primary subject from OL subjects
-        primary_subject = book.get("subjects_from_ol", [])[0] if book.get("subjects_from_ol") else ""
+        subjects = book["subjects_from_ol"]
+        primary_subject = subjects[0] if subjects else ""
         self.subject_for_strapi_var.set(primary_subject)
         
         self.course_var.set("")
@@ -345,36 +699,115 @@ class BookManagerApp:
 
         self.nav_label.config(text=f"Book {index + 1} of {len(self.books_data_list)}")
 
+        # Overlap the user's think-time with fetching the books they are likely to open next
+        for nb in (index + 1, index + 2, index - 1):
+            if 0 <= nb < len(self.books_data_list):
+                self._prefetch_book(self.books_data_list[nb])
+
+    def _prefetch_book(self, book):
+        """Warms the detail cache and the decoded cover cache for a book without touching any widget."""
+        if not book["description_loaded"]:
+            EXECUTOR.submit(fetch_book_details, book["openlibrary_key"])
+
+        cover_url = book["cover_url_medium"]
+        if cover_url in self._cover_cache or cover_url in self._covers_prefetching:
+            return
+        self._covers_prefetching.add(cover_url)
+        future = EXECUTOR.submit(fetch_cover_image, cover_url)
+        future.add_done_callback(lambda f: self._post_to_tk(self._store_prefetched_cover, cover_url, f))
+
+    def _store_prefetched_cover(self, cover_url, future):
+        self._covers_prefetching.discard(cover_url)
+        if cover_url == self._pending_cover_url:
+            # display_cover is waiting on this prefetch, so it gets the same handling as its own load
+            self._apply_cover(self._cover_request_id, cover_url, future)
+        elif future.exception() is None: # Best effort; display_cover retries and reports errors
+            self._cache_cover(cover_url, future.result())
+
+    def _apply_description(self, index, future):
+        """Stores a fetched description and shows it if that book is still displayed."""
+        try:
+            details, error_msg = future.result()
+        except Exception as e: # fetch_book_details reports expected failures itself; don't leave the placeholder up
+            details, error_msg = None, f"{type(e).__name__}: {e}"
+        book = self.books_data_list[index]
+        if details:
+            book["description"] = details.get("description", "Error fetching description.")
+        else:
+            book["description"] = f"Error fetching description: {error_msg}"
+        book["description_loaded"] = True # Mark as loaded
+
+        if self.current_book_index != index:
+            return
+        # Don't clobber text the user has started typing while the fetch was running
+        if self.description_text_widget.get("1.0", tk.END).strip() != "Loading description...":
+            return
+        self.description_text_widget.delete("1.0", tk.END)
+        self.description_text_widget.insert("1.0", book.get("description"))
 
     def display_cover(self, cover_url):
+        if cover_url and cover_url == self._pending_cover_url:
+            return # Same cover is already shown or still loading
+        self._pending_cover_url = cover_url
+        self._cover_request_id += 1 # Invalidate any load still in flight for the previous book
         if not cover_url:
             self.cover_label.config(image=None, text="No cover URL")
             return
 
-        try:
-            # In a real app, consider threading for network requests to not freeze GUI
-            response = requests.get(cover_url, timeout=10)
-            response.raise_for_status() # Raise an exception for bad status codes
-            
-            image_data = response.content
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Resize image to fit label (e.g., max height 250px, maintain aspect ratio)
-            max_h = 250
-            img_w, img_h = image.size
-            aspect_ratio = img_w / img_h
-            new_h = min(img_h, max_h)
-            new_w = int(new_h * aspect_ratio)
-            image = image.resize((new_w, new_h), Image.Resampling.LANCZOS)
-
-            photo_image = ImageTk.PhotoImage(image)
-            
+        photo_image = self._cover_cache.get(cover_url)
+        if photo_image is not None:
+            self._cover_cache.move_to_end(cover_url)
             self.cover_label.config(image=photo_image, text="")
-            self.cover_label.image = photo_image # Keep a reference!
+            self.cover_label.image = photo_image
+            return
+
+        self.cover_label.config(image=None, text="Cover loading...")
+        self.cover_label.image = None
+        if cover_url in self._covers_prefetching:
+            return # A prefetch is already fetching it; _store_prefetched_cover shows it when done
+        # Download and decode on a worker thread; only the PhotoImage is built on the Tk thread
+        request_id = self._cover_request_id
+        future = EXECUTOR.submit(fetch_cover_image, cover_url)
+        future.add_done_callback(lambda f: self._post_to_tk(self._apply_cover, request_id, cover_url, f))
+
+    def _cache_cover(self, cover_url, image):
+        """Builds the PhotoImage for a decoded cover (Tk thread only) and adds it to the LRU cache."""
+        photo_image = ImageTk.PhotoImage(image)
+        self._cover_cache[cover_url] = photo_image
+        if len(self._cover_cache) > COVER_CACHE_SIZE:
+            self._cover_cache.popitem(last=False) # Evict the least recently shown cover
+        return photo_image
+
+    def _apply_cover(self, request_id, cover_url, future):
+        stale = request_id != self._cover_request_id # The user has navigated since this load was started
+        try:
+            image = future.result()
+        except requests.HTTPError as e:
+            if not stale:
+                self._pending_cover_url = None # Allow a retry next time this book is shown
+                if e.response is not None and e.response.status_code == 404:
+                    self.cover_label.config(image=None, text="No cover available")
+                else:
+                    self.cover_label.config(image=None, text=f"Cover DL Error: {type(e).__name__}")
+            return
         except requests.RequestException as e:
-            self.cover_label.config(image=None, text=f"Cover DL Error: {type(e).__name__}")
+            if not stale:
+                self._pending_cover_url = None # Allow a retry next time this book is shown
+                self.cover_label.config(image=None, text=f"Cover DL Error: {type(e).__name__}")
+            return
         except Exception as e: # Catch PIL errors or others
-            self.cover_label.config(image=None, text=f"Cover Load Error: {type(e).__name__}")
+            if not stale:
+                self._pending_cover_url = None
+                self.cover_label.config(image=None, text=f"Cover Load Error: {type(e).__name__}")
+            return
+
+        # Keep stale results too; the work is done and the user may come back to this book
+        photo_image = self._cache_cover(cover_url, image)
+        if stale:
+            return
+        
+        self.cover_label.config(image=photo_image, text="")
+        self.cover_label.image = photo_image # Keep a reference!
 
 
     def next_book(self):
@@ -437,7 +870,7 @@ class BookManagerApp:
 
             categories_str = self.categories_strapi_ids_var.get()
             if categories_str:
-                data_payload["categories"] = [int(cat_id.strip()) for cat_id in categories_str.split(',') if cat_id.strip()]
+                data_payload["categories"] = parse_id_list(categories_str)
             
             cover_id_str = self.cover_strapi_id_var.get()
             if cover_id_str:
@@ -464,48 +897,116 @@ class BookManagerApp:
 
         final_json_output = {"data": data_payload}
         
-        print("\\n--- Data for Strapi (Book: {}) ---".format(current_ol_book.get("title")))
+        print("\n--- Data for Strapi (Book: {}) ---".format(current_ol_book.get("title")))
         print(json.dumps(final_json_output, indent=2))
         messagebox.showinfo("Exported", "Book data for Strapi printed to console.")
 
 
+# Anything that is not a letter or digit (Unicode-aware, like str.isalnum); replaced in one C-level pass
+_UNSAFE_FILENAME_CHARS = re.compile(r"[\W_]")
+
+def _cover_path(folder, i, book):
+    """Target Path for the i-th book's cover inside folder."""
+    # Sanitize filename
+    safe_title = _UNSAFE_FILENAME_CHARS.sub("_", book.get('title', 'Unknown_Title')[:50])
+    return folder / f"{i}_{safe_title}.jpg"
+
+MIN_COVER_BYTES = 1024 # Smaller files are treated as missing (e.g. placeholders or truncated writes)
+
+def _is_downloaded(path):
+    """True if path already holds a plausible cover from an earlier run."""
+    try:
+        return path.stat().st_size > MIN_COVER_BYTES
+    except OSError:
+        return False
+
+def _link_or_copy(src, dst):
+    """Hard-links dst to src, falling back to a copy where hard links are unsupported."""
+    if os.path.lexists(dst): # Left over from an earlier run (possibly already a link to src)
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _download_cover(session, cover_url, targets):
+    """Downloads cover_url once for every (path, title) target sharing it and returns a status message."""
+    path, title = targets[0]
+    try:
+        # Pooled keep-alive connection to covers.openlibrary.org; the body is streamed to disk, never held whole
+        with _limited_get(session, cover_url, stream=True, timeout=15) as res:
+            if res.status_code == 404:
+                return f"Skipping {title} - No real cover (placeholder only)."
+            if res.status_code != 200:
+                return f"Failed: {title} (Status: {res.status_code})"
+            # Write under a temporary name so an interrupted run never leaves a truncated cover behind
+            part_path = path.with_name(path.name + ".part")
+            _stream_to_file(res, part_path)
+            os.replace(part_path, path)
+        # Other editions with the same cover get the bytes we already have instead of another download
+        for dup_path, _ in targets[1:]:
+            _link_or_copy(path, dup_path)
+    except requests.exceptions.Timeout:
+        return f"Timeout downloading cover for: {title}"
+    except requests.RequestException as e:
+        return f"Error for {title}: {e}"
+    except OSError as e: # Disk full, permissions...; report it like a failed download instead of aborting the batch
+        return f"Error for {title}: {e}"
+
+    if len(targets) > 1:
+        return f"Downloaded: {title} (+{len(targets) - 1} other book(s) sharing this cover)"
+    return f"Downloaded: {title}"
+
 # Original function, can be used separately if needed for bulk downloads
-def download_covers_to_folder(books_data_list, folder_name="downloaded_book_covers"):
+def download_covers_to_folder(books_data_list, folder_name="downloaded_book_covers", *, session=None):
+    """Downloads every book's large cover into folder_name.
+
+    session defaults to the shared SESSION so bulk downloads reuse the same warm connections
+    as the rest of the app; pass another requests.Session to use your own. RATE_LIMITER
+    applies either way, but a custom session brings its own pooling and retry policy.
+    """
+    session = session or SESSION
     if not books_data_list:
         print("No book data provided to download_covers_to_folder.")
         return
 
-    os.makedirs(folder_name, exist_ok=True)
+    folder = Path(folder_name)
+    folder.mkdir(parents=True, exist_ok=True)
     total = len(books_data_list)
-    print(f"\\nStarting download of {total} covers to '{folder_name}' folder...")
-    
+    print(f"\nStarting download of {total} covers to '{folder_name}' folder...")
+
+    # Build every target path up front and group books by cover URL, so each distinct cover
+    # is downloaded only once and each task carries only a URL and its (path, title) targets
+    targets_by_url = defaultdict(list)
+    done = 0
     for i, book in enumerate(books_data_list, 1):
+        title = book.get('title', 'Unknown Title')
         cover_url = book.get("cover_url_large")
         if not cover_url:
-            print(f"[{i}/{total}] Skipping {book.get('title', 'Unknown Title')} - No cover URL.")
+            done += 1
+            print(f"[{i}/{total}] Skipping {title} - No cover URL.")
             continue
-
-        try:
-            res = requests.get(cover_url, timeout=15)
-            percent = int((i / total) * 100)
-            if res.status_code == 200:
-                # Sanitize filename
-                safe_title = "".join(c if c.isalnum() else "_" for c in book.get('title', 'Unknown_Title')[:50])
-                filename = f"{folder_name}/{i}_{safe_title}.jpg"
-                with open(filename, "wb") as f:
-                    f.write(res.content)
-                print(f"[{percent}%] Downloaded: {book.get('title', 'Unknown Title')}")
-            else:
-                print(f"[{percent}%] Failed: {book.get('title', 'Unknown Title')} (Status: {res.status_code})")
-        except requests.exceptions.Timeout:
-            print(f"[{percent}%] Timeout downloading cover for: {book.get('title', 'Unknown Title')}")
-        except requests.RequestException as e:
-            print(f"[{percent}%] Error for {book.get('title', 'Unknown Title')}: {e}")
-        time.sleep(0.05)
-    print("\\n✅ Cover download to folder finished.")
+        path = _cover_path(folder, i, book)
+        if _is_downloaded(path):
+            done += 1
+            print(f"[{i}/{total}] Already downloaded: {title}")
+            continue
+        targets_by_url[cover_url].append((path, title))
+    
+    # Downloads are network-bound, so run them concurrently on the shared executor
+    futures = {EXECUTOR.submit(_download_cover, session, url, targets): len(targets) for url, targets in targets_by_url.items()}
+    for future in as_completed(futures):
+        done += futures[future]
+        percent = int((done / total) * 100)
+        print(f"[{percent}%] {future.result()}")
+    print("\n✅ Cover download to folder finished.")
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    # Cover resizing is the one CPU-heavy step; the drop-in pillow-simd build
+    # (versions tagged ".postN") vectorizes it with SSE4/AVX2.
+    log.info("PIL build: %s (SIMD=%s)", PIL.__version__, ".post" in PIL.__version__)
     try:
         # For testing, fetch a small number of books
         num_books_to_fetch = input("How many random books do you want to fetch for the GUI? (e.g., 5-10): ")
@@ -524,8 +1025,10 @@ def main():
         root = tk.Tk()
         app = BookManagerApp(root, fetched_books)
         root.mainloop()
+        # Drop queued prefetches now; an atexit hook would run only after the workers drained the queue
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
         
-        print("\\n✅ Script finished.")
+        print("\n✅ Script finished.")
 
     except ValueError:
         print("Invalid input. Please enter a number.")
@@ -533,6 +1036,8 @@ def main():
         print(f"An unexpected error occurred in main: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        SESSION.close() # One session for the whole run; release its pooled connections once at exit
 
 if __name__ == "__main__":
     main()
\ No newline at end of file